@@ -8,6 +8,7 @@ features including model checkpointing, early stopping, and comprehensive loggin
 import argparse
 import logging
 import os
+import time
 from datetime import datetime
 from pathlib import Path
 
@@ -33,6 +34,174 @@ logging.basicConfig(
 logger = logging.getLogger(__name__)
 
 
+class BatchLRScheduler(callbacks.Callback):
+    """Per-batch one-cycle or warmup-cosine learning-rate schedule."""
+    
+    def __init__(self, max_lr, schedule='one_cycle', warmup_fraction=0.3,
+                 div_factor=25.0, final_div_factor=1e4):
+        """
+        Initialize the scheduler.
+        
+        Args:
+            max_lr (float): Peak learning rate
+            schedule (str): 'one_cycle' or 'warmup_cosine'
+            warmup_fraction (float): Fraction of steps spent warming up
+            div_factor (float): One-cycle initial LR is max_lr / div_factor
+            final_div_factor (float): One-cycle final LR is initial LR / final_div_factor
+        """
+        super().__init__()
+        if schedule not in ('one_cycle', 'warmup_cosine'):
+            raise ValueError(f"Unknown lr_schedule: {schedule}")
+        self.max_lr = max_lr
+        self.schedule = schedule
+        self.warmup_fraction = warmup_fraction
+        self.div_factor = div_factor
+        self.final_div_factor = final_div_factor
+        self.total_steps = 1
+        self.step = 0
+        self.last_lr = None
+    
+    def on_train_begin(self, logs=None):
+        self.total_steps = max(1, self.params['epochs'] * self.params['steps'])
+        self.step = 0
+    
+    def on_train_batch_begin(self, batch, logs=None):
+        self.last_lr = float(self.compute_lr(self.step))
+        self.model.optimizer.learning_rate.assign(self.last_lr)
+    
+    def on_train_batch_end(self, batch, logs=None):
+        self.step += 1
+    
+    def on_epoch_end(self, epoch, logs=None):
+        # Expose the last LR of the epoch to History and CSVLogger
+        if logs is not None and self.last_lr is not None:
+            logs['learning_rate'] = self.last_lr
+    
+    def compute_lr(self, step):
+        """
+        Compute the learning rate for a given training step.
+        
+        Args:
+            step (int): Global training step
+            
+        Returns:
+            float: Learning rate
+        """
+        warmup_steps = max(1, int(self.total_steps * self.warmup_fraction))
+        step = min(step, self.total_steps)
+        
+        if self.schedule == 'one_cycle':
+            initial_lr = self.max_lr / self.div_factor
+            final_lr = initial_lr / self.final_div_factor
+            if step < warmup_steps:
+                return self._cosine(initial_lr, self.max_lr, step / warmup_steps)
+            progress = (step - warmup_steps) / max(1, self.total_steps - warmup_steps)
+            return self._cosine(self.max_lr, final_lr, progress)
+        
+        if step < warmup_steps:
+            return self.max_lr * (step + 1) / warmup_steps
+        progress = (step - warmup_steps) / max(1, self.total_steps - warmup_steps)
+        return self._cosine(self.max_lr, 0.0, progress)
+    
+    @staticmethod
+    def _cosine(start, end, progress):
+        """Cosine interpolation from start to end as progress goes 0 -> 1."""
+        return end + (start - end) * (1 + np.cos(np.pi * progress)) / 2
+
+
+class LRRangeTest(callbacks.Callback):
+    """Exponentially increase the learning rate each batch and record the loss."""
+    
+    def __init__(self, min_lr, max_lr, num_steps, smoothing=0.98):
+        """
+        Initialize the range test.
+        
+        Args:
+            min_lr (float): Starting learning rate
+            max_lr (float): Final learning rate
+            num_steps (int): Number of batches to sweep over
+            smoothing (float): Exponential smoothing factor for the loss
+        """
+        super().__init__()
+        self.min_lr = min_lr
+        self.max_lr = max_lr
+        self.num_steps = num_steps
+        self.smoothing = smoothing
+        self.learning_rates = []
+        self.losses = []
+        self._avg_loss = 0.0
+        self._prev_mean_loss = 0.0
+        self._best_loss = np.inf
+    
+    def _lr_at(self, step):
+        return self.min_lr * (self.max_lr / self.min_lr) ** (step / max(1, self.num_steps - 1))
+    
+    def on_train_batch_begin(self, batch, logs=None):
+        self.model.optimizer.learning_rate.assign(self._lr_at(len(self.learning_rates)))
+    
+    def on_train_batch_end(self, batch, logs=None):
+        step = len(self.learning_rates)
+        
+        # Keras reports the running mean of the loss since the start of the
+        # epoch; recover the loss of this batch before smoothing it.
+        mean_loss = logs['loss']
+        if batch == 0:
+            loss = mean_loss
+        else:
+            loss = (batch + 1) * mean_loss - batch * self._prev_mean_loss
+        self._prev_mean_loss = mean_loss
+        
+        self._avg_loss = self.smoothing * self._avg_loss + (1 - self.smoothing) * loss
+        smoothed = self._avg_loss / (1 - self.smoothing ** (step + 1))
+        
+        self.learning_rates.append(self._lr_at(step))
+        self.losses.append(smoothed)
+        self._best_loss = min(self._best_loss, smoothed)
+        
+        # Stop once the loss diverges or the sweep is complete
+        if (not np.isfinite(smoothed) or smoothed > 4 * self._best_loss
+                or step + 1 >= self.num_steps):
+            self.model.stop_training = True
+
+
+class TargetAccuracyTracker(callbacks.Callback):
+    """Record the epoch and wall time at which a target accuracy is first reached."""
+    
+    def __init__(self, target_accuracy, monitor='val_accuracy'):
+        """
+        Initialize the tracker.
+        
+        Args:
+            target_accuracy (float): Accuracy to reach
+            monitor (str): Metric to compare against the target
+        """
+        super().__init__()
+        self.target_accuracy = target_accuracy
+        self.monitor = monitor
+        self.result = {}
+    
+    def on_train_begin(self, logs=None):
+        self._start_time = time.perf_counter()
+        self.result = {
+            'target_accuracy': self.target_accuracy,
+            'epochs_to_target': None,
+            'seconds_to_target': None,
+            'total_epochs': 0,
+            'total_seconds': 0.0
+        }
+    
+    def on_epoch_end(self, epoch, logs=None):
+        logs = logs or {}
+        self.result['total_epochs'] = epoch + 1
+        if (self.result['epochs_to_target'] is None
+                and logs.get(self.monitor, 0.0) >= self.target_accuracy):
+            self.result['epochs_to_target'] = epoch + 1
+            self.result['seconds_to_target'] = time.perf_counter() - self._start_time
+    
+    def on_train_end(self, logs=None):
+        self.result['total_seconds'] = time.perf_counter() - self._start_time
+
+
 class DeepVisionNet:
     """Deep learning model for MNIST digit classification."""
     
@@ -46,6 +215,7 @@ class DeepVisionNet:
         self.config = config or self._default_config()
         self.model = None
         self.history = None
+        self.time_to_target = None
         
     def _default_config(self):
         """Return default configuration."""
@@ -53,8 +223,18 @@ class DeepVisionNet:
             'epochs': 20,
             'batch_size': 128,
             'learning_rate': 0.001,
+            'lr_schedule': 'plateau',
+            'max_learning_rate': 0.01,
+            'warmup_fraction': 0.3,
+            'target_accuracy': 0.99,
             'validation_split': 0.1,
             'conv_filters': [32, 64],
+            'conv_kernel_size': [3, 3],
+            'pool_size': [2, 2],
+            'use_batch_normalization': True,
+            'conv_block_type': 'standard',
+            'downsampling': 'maxpool',
+            'head': 'flatten',
             'dense_units': 128,
             'dropout_rate': 0.5,
             'early_stopping_patience': 5,
@@ -99,27 +279,30 @@ class DeepVisionNet:
         """
         logger.info("Building model architecture...")
         
-        model = keras.Sequential([
-            layers.Input(shape=input_shape),
-            
-            # First convolutional block
-            layers.Conv2D(self.config['conv_filters'][0], (3, 3), 
-                         activation='relu', padding='same'),
-            layers.BatchNormalization(),
-            layers.MaxPooling2D((2, 2)),
-            
-            # Second convolutional block
-            layers.Conv2D(self.config['conv_filters'][1], (3, 3), 
-                         activation='relu', padding='same'),
-            layers.BatchNormalization(),
-            layers.MaxPooling2D((2, 2)),
-            
-            # Dense layers
-            layers.Flatten(),
-            layers.Dense(self.config['dense_units'], activation='relu'),
-            layers.Dropout(self.config['dropout_rate']),
-            layers.Dense(num_classes, activation='softmax')
-        ])
+        model_layers = [layers.Input(shape=input_shape)]
+        
+        # Convolutional blocks
+        for filters in self.config['conv_filters']:
+            model_layers.extend(self._build_conv_block(filters))
+        
+        # Classification head
+        head = self.config.get('head', 'flatten')
+        if head == 'flatten':
+            model_layers.extend([
+                layers.Flatten(),
+                layers.Dense(self.config['dense_units'], activation='relu'),
+                layers.Dropout(self.config['dropout_rate']),
+            ])
+        elif head == 'global_avg_pool':
+            model_layers.extend([
+                layers.GlobalAveragePooling2D(),
+                layers.Dropout(self.config['dropout_rate']),
+            ])
+        else:
+            raise ValueError(f"Unknown head: {head}")
+        
+        model_layers.append(layers.Dense(num_classes, activation='softmax'))
+        model = keras.Sequential(model_layers)
         
         # Compile model
         optimizer = keras.optimizers.Adam(learning_rate=self.config['learning_rate'])
@@ -134,10 +317,131 @@ class DeepVisionNet:
         
         return model
     
+    def _build_conv_block(self, filters):
+        """
+        Build the layers of a single convolutional block.
+        
+        The block honours ``conv_kernel_size``, ``pool_size`` and
+        ``use_batch_normalization``. ``conv_block_type`` selects a standard
+        or depthwise-separable convolution, and ``downsampling`` selects
+        max pooling or a strided convolution.
+        
+        Args:
+            filters (int): Number of output filters
+            
+        Returns:
+            list: Keras layers for the block
+        """
+        kernel_size = tuple(self.config.get('conv_kernel_size', [3, 3]))
+        pool_size = tuple(self.config.get('pool_size', [2, 2]))
+        block_type = self.config.get('conv_block_type', 'standard')
+        downsampling = self.config.get('downsampling', 'maxpool')
+        
+        if block_type == 'standard':
+            conv_layer = layers.Conv2D
+        elif block_type == 'separable':
+            conv_layer = layers.SeparableConv2D
+        else:
+            raise ValueError(f"Unknown conv_block_type: {block_type}")
+        
+        if downsampling == 'maxpool':
+            strides = (1, 1)
+        elif downsampling == 'strided':
+            strides = pool_size
+        else:
+            raise ValueError(f"Unknown downsampling: {downsampling}")
+        
+        block = [conv_layer(filters, kernel_size, strides=strides,
+                            activation='relu', padding='same')]
+        if self.config.get('use_batch_normalization', True):
+            block.append(layers.BatchNormalization())
+        if downsampling == 'maxpool':
+            block.append(layers.MaxPooling2D(pool_size))
+        
+        return block
+    
+    def count_flops(self):
+        """
+        Estimate the FLOPs of a single forward pass.
+        
+        Counts multiply-adds (as 2 FLOPs) of the convolutional and dense
+        layers, which dominate the cost of the network.
+        
+        Returns:
+            int: Estimated FLOPs per image
+        """
+        if self.model is None:
+            raise ValueError("Model not built. Call build_model() first.")
+        
+        flops = 0
+        for layer in self.model.layers:
+            if isinstance(layer, layers.SeparableConv2D):
+                in_channels = layer.input.shape[-1]
+                _, out_h, out_w, out_channels = layer.output.shape
+                kernel_h, kernel_w = layer.kernel_size
+                depthwise = out_h * out_w * kernel_h * kernel_w * in_channels
+                pointwise = out_h * out_w * in_channels * out_channels
+                flops += 2 * (depthwise + pointwise)
+            elif isinstance(layer, layers.Conv2D):
+                in_channels = layer.input.shape[-1]
+                _, out_h, out_w, out_channels = layer.output.shape
+                kernel_h, kernel_w = layer.kernel_size
+                flops += 2 * out_h * out_w * kernel_h * kernel_w * in_channels * out_channels
+            elif isinstance(layer, layers.Dense):
+                flops += 2 * layer.input.shape[-1] * layer.units
+        
+        return int(flops)
+    
+    def measure_latency(self, batch_size=1, num_runs=50, warmup_runs=5):
+        """
+        Measure inference latency on CPU.
+        
+        The forward pass is compiled with ``tf.function`` and traced during
+        the warmup runs, so the timing reflects compute rather than per-op
+        eager dispatch. A copy of the model is created under the CPU device
+        scope so that, on GPU hosts, weights are not copied on every call.
+        
+        Args:
+            batch_size (int): Number of images per forward pass
+            num_runs (int): Number of timed forward passes
+            warmup_runs (int): Untimed forward passes run first
+            
+        Returns:
+            float: Median latency in milliseconds
+        """
+        if self.model is None:
+            raise ValueError("Model not built. Call build_model() first.")
+        
+        input_shape = self.model.input_shape[1:]
+        x = np.random.rand(batch_size, *input_shape).astype('float32')
+        
+        timings = []
+        with tf.device('/CPU:0'):
+            cpu_model = keras.models.clone_model(self.model)
+            cpu_model.set_weights(self.model.get_weights())
+            x = tf.constant(x)
+            
+            @tf.function
+            def forward(inputs):
+                return cpu_model(inputs, training=False)
+            
+            for _ in range(max(1, warmup_runs)):
+                forward(x).numpy()
+            for _ in range(num_runs):
+                start = time.perf_counter()
+                forward(x).numpy()
+                timings.append((time.perf_counter() - start) * 1000)
+        
+        return float(np.median(timings))
+    
     def get_callbacks(self):
         """
         Create training callbacks.
         
+        Early stopping is controlled by the ``early_stopping`` config key. When
+        unset, it is enabled for the ``plateau`` schedule only: the per-batch
+        schedules must run all epochs to reach their annealing phase.
+        
         Returns:
             list: List of Keras callbacks
         """
@@ -153,26 +457,130 @@ class DeepVisionNet:
                 save_best_only=True,
                 mode='max',
                 verbose=1
-            ),
-            callbacks.EarlyStopping(
+            )
+        ]
+        
+        early_stopping = self.config.get('early_stopping')
+        if early_stopping is None:
+            early_stopping = self.config.get('lr_schedule', 'plateau') == 'plateau'
+        if early_stopping:
+            callback_list.append(callbacks.EarlyStopping(
                 monitor='val_loss',
                 patience=self.config['early_stopping_patience'],
                 restore_best_weights=True,
                 verbose=1
-            ),
-            callbacks.ReduceLROnPlateau(
+            ))
+        
+        callback_list.extend([
+            self._get_lr_callback(),
+            callbacks.CSVLogger(
+                output_dir / f'training_log_{timestamp}.csv'
+            )
+        ])
+        
+        return callback_list
+    
+    def _get_lr_callback(self):
+        """
+        Create the learning-rate callback selected by ``lr_schedule``.
+        
+        Returns:
+            keras.callbacks.Callback: Learning-rate callback
+        """
+        schedule = self.config.get('lr_schedule', 'plateau')
+        if schedule == 'plateau':
+            return callbacks.ReduceLROnPlateau(
                 monitor='val_loss',
                 factor=0.5,
                 patience=3,
                 min_lr=1e-7,
                 verbose=1
-            ),
-            callbacks.CSVLogger(
-                output_dir / f'training_log_{timestamp}.csv'
             )
-        ]
+        return BatchLRScheduler(
+            max_lr=self.config.get('max_learning_rate', self.config['learning_rate']),
+            schedule=schedule,
+            warmup_fraction=self.config.get('warmup_fraction', 0.3)
+        )
+    
+    def find_learning_rate(self, x_train, y_train, min_lr=1e-7, max_lr=1.0,
+                           num_steps=100, save_path=None):
+        """
+        Run a learning-rate range test and suggest an LR range.
         
-        return callback_list
+        The learning rate is increased exponentially each batch while the
+        smoothed loss is recorded. The suggested maximum LR is one tenth of
+        the LR at which the loss is lowest. The model is rebuilt afterwards
+        so training starts from fresh weights.
+        
+        Args:
+            x_train: Training data
+            y_train: Training labels
+            min_lr (float): Starting learning rate
+            max_lr (float): Final learning rate
+            num_steps (int): Number of batches to sweep over
+            save_path (str): Directory to save the LR/loss plot
+            
+        Returns:
+            dict: Learning rates, losses and suggested LR range
+        """
+        if self.model is None:
+            raise ValueError("Model not built. Call build_model() first.")
+        
+        logger.info("Running learning-rate range test...")
+        
+        batch_size = self.config['batch_size']
+        num_samples = min(len(x_train), num_steps * batch_size)
+        range_test = LRRangeTest(min_lr, max_lr, num_steps)
+        epochs = int(np.ceil(num_steps * batch_size / num_samples))
+        
+        self.model.fit(
+            x_train[:num_samples], y_train[:num_samples],
+            batch_size=batch_size,
+            epochs=epochs,
+            callbacks=[range_test],
+            verbose=0
+        )
+        
+        learning_rates = np.array(range_test.learning_rates)
+        losses = np.array(range_test.losses)
+        lr_at_min_loss = float(learning_rates[np.nanargmin(losses)])
+        suggested_max_lr = lr_at_min_loss / 10
+        suggested_min_lr = suggested_max_lr / 25
+        
+        logger.info(f"Lowest loss at LR {lr_at_min_loss:.2e}")
+        logger.info(f"Suggested LR range: {suggested_min_lr:.2e} - {suggested_max_lr:.2e}")
+        
+        if save_path is None:
+            save_path = Path(self.config['output_dir'])
+        else:
+            save_path = Path(save_path)
+        save_path.mkdir(exist_ok=True)
+        
+        plt.figure(figsize=(6, 4))
+        plt.plot(learning_rates, losses)
+        plt.axvspan(suggested_min_lr, suggested_max_lr, alpha=0.2, color='green',
+                    label='Suggested range')
+        plt.xscale('log')
+        plt.xlabel('Learning Rate')
+        plt.ylabel('Loss')
+        plt.title('Learning Rate Range Test')
+        plt.legend()
+        plt.grid(True)
+        plt.tight_layout()
+        plt.savefig(save_path / 'lr_range_test.png', dpi=300, bbox_inches='tight')
+        logger.info(f"LR range plot saved to {save_path / 'lr_range_test.png'}")
+        plt.close()
+        
+        # Discard the weights and optimizer state touched by the sweep
+        self.build_model(input_shape=self.model.input_shape[1:],
+                         num_classes=self.model.output_shape[-1])
+        
+        return {
+            'learning_rates': learning_rates.tolist(),
+            'losses': losses.tolist(),
+            'suggested_min_lr': suggested_min_lr,
+            'suggested_max_lr': suggested_max_lr
+        }
     
     def train(self, x_train, y_train, x_val=None, y_val=None):
         """
@@ -200,6 +608,8 @@ class DeepVisionNet:
             validation_split = 0.0
             validation_data = (x_val, y_val)
         
+        tracker = TargetAccuracyTracker(self.config.get('target_accuracy', 0.99))
+        
         # Train model
         self.history = self.model.fit(
             x_train, y_train,
@@ -207,11 +617,20 @@ class DeepVisionNet:
             epochs=self.config['epochs'],
             validation_split=validation_split,
             validation_data=validation_data,
-            callbacks=self.get_callbacks(),
+            callbacks=self.get_callbacks() + [tracker],
             verbose=1
         )
         
+        self.time_to_target = tracker.result
         logger.info("Training completed!")
+        if self.time_to_target['epochs_to_target'] is None:
+            logger.info(f"Target accuracy {self.time_to_target['target_accuracy']:.4f} "
+                        f"not reached in {self.time_to_target['total_epochs']} epochs "
+                        f"({self.time_to_target['total_seconds']:.1f}s)")
+        else:
+            logger.info(f"Target accuracy {self.time_to_target['target_accuracy']:.4f} "
+                        f"reached at epoch {self.time_to_target['epochs_to_target']} "
+                        f"({self.time_to_target['seconds_to_target']:.1f}s)")
         return self.history
     
     def evaluate(self, x_test, y_test):
@@ -311,12 +730,58 @@ class DeepVisionNet:
             output_dir.mkdir(exist_ok=True)
             filepath = output_dir / 'model_summary.txt'
         
+        flops = self.count_flops()
+        latency_ms = self.measure_latency()
+        
         with open(filepath, 'w') as f:
             self.model.summary(print_fn=lambda x: f.write(x + '\n'))
-        
+            f.write(f"Block type: {self.config.get('conv_block_type', 'standard')}\n")
+            f.write(f"Downsampling: {self.config.get('downsampling', 'maxpool')}\n")
+            f.write(f"Head: {self.config.get('head', 'flatten')}\n")
+            f.write(f"FLOPs per image: {flops:,}\n")
+            f.write(f"CPU latency (batch 1, median): {latency_ms:.3f} ms\n")
+        
+        logger.info(f"FLOPs per image: {flops:,}")
+        logger.info(f"CPU latency (batch 1, median): {latency_ms:.3f} ms")
         logger.info(f"Model summary saved to {filepath}")
 
 
+def compare_lr_schedules(config, x_train, y_train, x_val, y_val,
+                         schedules=('plateau', 'one_cycle')):
+    """
+    Train one model per LR schedule and compare time to target accuracy.
+    
+    Args:
+        config (dict): Base configuration; ``lr_schedule`` is overridden
+        x_train: Training data
+        y_train: Training labels
+        x_val: Validation data
+        y_val: Validation labels
+        schedules (tuple): LR schedules to compare
+        
+    Returns:
+        dict: Time-to-target results keyed by schedule
+    """
+    results = {}
+    for schedule in schedules:
+        logger.info(f"Training with lr_schedule={schedule}")
+        dvn = DeepVisionNet({**config, 'lr_schedule': schedule})
+        dvn.build_model()
+        dvn.train(x_train, y_train, x_val, y_val)
+        results[schedule] = dvn.time_to_target
+    
+    logger.info("="*50)
+    logger.info(f"{'Schedule':<15}{'Epochs':>8}{'Seconds':>10}{'Total (s)':>12}")
+    for schedule, result in results.items():
+        epochs = result['epochs_to_target'] or '-'
+        seconds = (f"{result['seconds_to_target']:.1f}"
+                   if result['seconds_to_target'] is not None else '-')
+        logger.info(f"{schedule:<15}{epochs:>8}{seconds:>10}{result['total_seconds']:>12.1f}")
+    logger.info("="*50)
+    
+    return results
+
+
 def main():
     """Main execution function."""
     parser = argparse.ArgumentParser(
@@ -330,6 +795,26 @@ def main():
                        help='Learning rate (default: 0.001)')
     parser.add_argument('--output-dir', type=str, default='results',
                        help='Output directory for results (default: results)')
+    parser.add_argument('--block-type', type=str, default='standard',
+                       choices=['standard', 'separable'],
+                       help='Convolution block type (default: standard)')
+    parser.add_argument('--downsampling', type=str, default='maxpool',
+                       choices=['maxpool', 'strided'],
+                       help='Downsampling method (default: maxpool)')
+    parser.add_argument('--head', type=str, default='flatten',
+                       choices=['flatten', 'global_avg_pool'],
+                       help='Classification head (default: flatten)')
+    parser.add_argument('--lr-schedule', type=str, default='plateau',
+                       choices=['plateau', 'one_cycle', 'warmup_cosine'],
+                       help='Learning-rate schedule (default: plateau)')
+    parser.add_argument('--max-learning-rate', type=float, default=0.01,
+                       help='Peak LR for one_cycle/warmup_cosine (default: 0.01)')
+    parser.add_argument('--target-accuracy', type=float, default=0.99,
+                       help='Validation accuracy used to report time to target (default: 0.99)')
+    parser.add_argument('--find-lr', action='store_true',
+                       help='Run a learning-rate range test and exit')
+    parser.add_argument('--compare-schedules', action='store_true',
+                       help='Compare --lr-schedule against plateau and exit')
     
     args = parser.parse_args()
     
@@ -338,8 +823,18 @@ def main():
         'epochs': args.epochs,
         'batch_size': args.batch_size,
         'learning_rate': args.learning_rate,
+        'lr_schedule': args.lr_schedule,
+        'max_learning_rate': args.max_learning_rate,
+        'warmup_fraction': 0.3,
+        'target_accuracy': args.target_accuracy,
         'validation_split': 0.1,
         'conv_filters': [32, 64],
+        'conv_kernel_size': [3, 3],
+        'pool_size': [2, 2],
+        'use_batch_normalization': True,
+        'conv_block_type': args.block_type,
+        'downsampling': args.downsampling,
+        'head': args.head,
         'dense_units': 128,
         'dropout_rate': 0.5,
         'early_stopping_patience': 5,
@@ -355,6 +850,16 @@ def main():
         
         # Build model
         dvn.build_model()
+        
+        if args.find_lr:
+            dvn.find_learning_rate(x_train, y_train)
+            return
+        
+        if args.compare_schedules:
+            schedules = tuple(dict.fromkeys(('plateau', args.lr_schedule)))
+            compare_lr_schedules(config, x_train, y_train, x_test, y_test, schedules)
+            return
+        
         dvn.save_summary()
         
         # Train model
@@ -9,11 +9,13 @@ import numpy as np
 import tensorflow as tf
 from pathlib import Path
 import sys
+from types import SimpleNamespace
 
 # Adiciona o diretório raiz ao path
 sys.path.append(str(Path(__file__).parent))
 
-from DeepVisionNet import DeepVisionNet
+from DeepVisionNet import (BatchLRScheduler, DeepVisionNet, LRRangeTest,
+                           compare_lr_schedules)
 
 
 class TestDeepVisionNet:
@@ -84,6 +86,66 @@ class TestDeepVisionNet:
         # Verifica número de camadas
         assert len(model.layers) > 5
     
+    def test_build_model_efficient_blocks(self, config):
+        """Testa blocos separáveis, convolução com stride e GAP."""
+        config.update({
+            'conv_block_type': 'separable',
+            'downsampling': 'strided',
+            'head': 'global_avg_pool'
+        })
+        dvn = DeepVisionNet(config)
+        model = dvn.build_model()
+        
+        layer_types = [type(layer).__name__ for layer in model.layers]
+        assert 'SeparableConv2D' in layer_types
+        assert 'MaxPooling2D' not in layer_types
+        assert 'Flatten' not in layer_types
+        assert 'GlobalAveragePooling2D' in layer_types
+        assert model.output_shape == (None, 10)
+    
+    def test_build_model_without_batch_normalization(self, config):
+        """Testa que use_batch_normalization é respeitado."""
+        config['use_batch_normalization'] = False
+        dvn = DeepVisionNet(config)
+        model = dvn.build_model()
+        
+        layer_types = [type(layer).__name__ for layer in model.layers]
+        assert 'BatchNormalization' not in layer_types
+    
+    def test_build_model_invalid_block_type(self, config):
+        """Testa erro para tipo de bloco desconhecido."""
+        config['conv_block_type'] = 'unknown'
+        dvn = DeepVisionNet(config)
+        
+        with pytest.raises(ValueError):
+            dvn.build_model()
+    
+    def test_count_flops(self, config):
+        """Testa que blocos eficientes reduzem os FLOPs."""
+        baseline = DeepVisionNet(dict(config))
+        baseline.build_model()
+        
+        config.update({
+            'conv_block_type': 'separable',
+            'downsampling': 'strided',
+            'head': 'global_avg_pool'
+        })
+        efficient = DeepVisionNet(config)
+        efficient.build_model()
+        
+        assert baseline.count_flops() > efficient.count_flops() > 0
+    
+    def test_save_summary_reports_cost(self, dvn, tmp_path):
+        """Testa que o resumo inclui FLOPs e latência."""
+        dvn.build_model()
+        
+        summary_path = tmp_path / "model_summary.txt"
+        dvn.save_summary(summary_path)
+        
+        content = summary_path.read_text()
+        assert 'FLOPs per image' in content
+        assert 'CPU latency' in content
+    
     def test_model_compilation(self, dvn):
         """Testa compilação do modelo."""
         dvn.build_model()
@@ -109,6 +171,75 @@ class TestDeepVisionNet:
         assert 'ReduceLROnPlateau' in callback_types
         assert 'CSVLogger' in callback_types
     
+    def test_get_callbacks_one_cycle(self, config):
+        """Testa que one_cycle substitui o ReduceLROnPlateau e desativa o EarlyStopping."""
+        config['lr_schedule'] = 'one_cycle'
+        dvn = DeepVisionNet(config)
+        dvn.build_model()
+        callbacks_list = dvn.get_callbacks()
+        
+        callback_types = [type(cb).__name__ for cb in callbacks_list]
+        assert len(callbacks_list) == 3
+        assert 'BatchLRScheduler' in callback_types
+        assert 'ReduceLROnPlateau' not in callback_types
+        assert 'EarlyStopping' not in callback_types
+    
+    def test_get_callbacks_early_stopping_override(self, config):
+        """Testa que early_stopping pode ser reativado com one_cycle."""
+        config.update({'lr_schedule': 'one_cycle', 'early_stopping': True})
+        dvn = DeepVisionNet(config)
+        dvn.build_model()
+        
+        callback_types = [type(cb).__name__ for cb in dvn.get_callbacks()]
+        assert 'EarlyStopping' in callback_types
+    
+    @pytest.mark.parametrize('schedule', ['one_cycle', 'warmup_cosine'])
+    def test_lr_schedule_shape(self, schedule):
+        """Testa que o LR aquece até o pico e depois decai."""
+        scheduler = BatchLRScheduler(max_lr=0.01, schedule=schedule, warmup_fraction=0.3)
+        scheduler.total_steps = 100
+        
+        lrs = [scheduler.compute_lr(step) for step in range(101)]
+        assert np.isclose(max(lrs), 0.01)
+        assert np.argmax(lrs) in (29, 30)
+        assert 0.0 < lrs[0] < 0.01
+        assert lrs[-1] < lrs[0]
+    
+    def test_invalid_lr_schedule(self):
+        """Testa erro para schedule desconhecido."""
+        with pytest.raises(ValueError):
+            BatchLRScheduler(max_lr=0.01, schedule='unknown')
+    
+    def test_lr_range_test_records_per_batch_loss(self):
+        """Testa que o range test usa a loss de cada batch, não a média do epoch."""
+        range_test = LRRangeTest(min_lr=1e-4, max_lr=1.0, num_steps=10, smoothing=0.0)
+        range_test.set_model(SimpleNamespace(stop_training=False))
+        
+        # Dois epochs de dois batches; Keras reporta a média acumulada no epoch
+        batch_losses = [[1.0, 0.5], [0.25, 2.0]]
+        for epoch_losses in batch_losses:
+            for batch, _ in enumerate(epoch_losses):
+                running_mean = np.mean(epoch_losses[:batch + 1])
+                range_test.on_train_batch_end(batch, {'loss': running_mean})
+        
+        assert np.allclose(range_test.losses, [1.0, 0.5, 0.25, 2.0])
+        assert np.argmin(range_test.losses) == 2
+        # 2.0 > 4 * 0.25: a divergência interrompe a varredura
+        assert range_test.model.stop_training
+    
+    def test_find_learning_rate(self, dvn, tmp_path):
+        """Testa o LR range test."""
+        (x_train, y_train), _ = dvn.load_data()
+        dvn.build_model()
+        
+        result = dvn.find_learning_rate(x_train[:2000], y_train[:2000],
+                                        num_steps=30, save_path=tmp_path)
+        
+        assert 0 < len(result['learning_rates']) <= 30
+        assert len(result['learning_rates']) == len(result['losses'])
+        assert 0 < result['suggested_min_lr'] < result['suggested_max_lr']
+        assert (tmp_path / 'lr_range_test.png').exists()
+    
     def test_training_small_sample(self, dvn):
         """Testa treinamento com amostra pequena."""
         # Carrega dados
@@ -129,6 +260,55 @@ class TestDeepVisionNet:
         assert 'accuracy' in history.history
         assert 'loss' in history.history
         assert len(history.history['accuracy']) <= dvn.config['epochs']
+        
+        # Verifica relatório de tempo até a acurácia alvo
+        assert dvn.time_to_target['total_epochs'] == len(history.history['accuracy'])
+        assert dvn.time_to_target['total_seconds'] > 0.0
+    
+    def test_training_one_cycle(self, config):
+        """Testa o BatchLRScheduler dentro de um fit real."""
+        config.update({'epochs': 2, 'lr_schedule': 'one_cycle', 'max_learning_rate': 0.01})
+        dvn = DeepVisionNet(config)
+        (x_train, y_train), (x_test, y_test) = dvn.load_data()
+        
+        dvn.build_model()
+        initial_lr = float(dvn.model.optimizer.learning_rate.numpy())
+        history = dvn.train(x_train[:500], y_train[:500], x_test[:100], y_test[:100])
+        final_lr = float(dvn.model.optimizer.learning_rate.numpy())
+        
+        # Sem EarlyStopping, todos os epochs são executados
+        assert len(history.history['accuracy']) == 2
+        assert 'learning_rate' in history.history
+        assert not np.isclose(initial_lr, final_lr)
+        assert final_lr < 0.01 / 25
+    
+    def test_training_reaches_target(self, config):
+        """Testa o registro de épocas e tempo até a acurácia alvo."""
+        config.update({'epochs': 1, 'target_accuracy': 0.0})
+        dvn = DeepVisionNet(config)
+        (x_train, y_train), (x_test, y_test) = dvn.load_data()
+        
+        dvn.build_model()
+        dvn.train(x_train[:500], y_train[:500], x_test[:100], y_test[:100])
+        
+        assert dvn.time_to_target['epochs_to_target'] == 1
+        assert 0.0 < dvn.time_to_target['seconds_to_target'] <= dvn.time_to_target['total_seconds']
+    
+    def test_compare_lr_schedules(self, config):
+        """Testa a comparação entre schedules de LR."""
+        config.update({'epochs': 1, 'target_accuracy': 0.0})
+        dvn = DeepVisionNet(config)
+        (x_train, y_train), (x_test, y_test) = dvn.load_data()
+        
+        results = compare_lr_schedules(
+            config, x_train[:500], y_train[:500], x_test[:100], y_test[:100],
+            schedules=('plateau', 'warmup_cosine')
+        )
+        
+        assert set(results) == {'plateau', 'warmup_cosine'}
+        for result in results.values():
+            assert result['epochs_to_target'] == 1
+            assert result['total_epochs'] == 1
     
     def test_evaluate(self, dvn):
         """Testa avaliação do modelo."""